@@ -10,6 +10,7 @@ with the MCP service.
 import asyncio
 import base64
 import logging
+import sys
 import threading
 import uuid
 from asyncio import AbstractEventLoop
@@ -227,8 +228,13 @@ class MCPClient:
             return await self._background_thread_session.call_tool(name, arguments, read_timeout_seconds)
 
         try:
-            future = self._invoke_on_background_thread(_call_tool_async())
-            call_tool_result: MCPCallToolResult = await asyncio.wrap_future(future)
+            call_tool_result: MCPCallToolResult
+            if threading.current_thread() is self._background_thread:
+                # Already running on the background event loop, so skip the cross-thread handoff
+                call_tool_result = await _call_tool_async()
+            else:
+                future = self._invoke_on_background_thread(_call_tool_async())
+                call_tool_result = await asyncio.wrap_future(future)
             return self._handle_tool_result(tool_use_id, call_tool_result)
         except Exception as e:
             logger.exception("tool execution failed")
@@ -299,6 +305,9 @@ class MCPClient:
         """
         self._log_debug_with_thread("setting up background task event loop")
         self._background_thread_event_loop = asyncio.new_event_loop()
+        if sys.version_info >= (3, 12):
+            # Coroutines submitted from other threads start running immediately instead of waiting a loop iteration
+            self._background_thread_event_loop.set_task_factory(asyncio.eager_task_factory)
         asyncio.set_event_loop(self._background_thread_event_loop)
         self._background_thread_event_loop.run_until_complete(self._async_background_thread())
 
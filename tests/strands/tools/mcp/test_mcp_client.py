@@ -1,5 +1,6 @@
-import time
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import sys
+from unittest.mock import MagicMock, patch
 
 import pytest
 from mcp import ListToolsResult
@@ -10,13 +11,94 @@ from mcp.types import Tool as MCPTool
 from strands.tools.mcp import MCPClient
 from strands.types.exceptions import MCPClientInitializationError
 
+# Validated once per module; tests build their results from these shared instances
+_TOOL = MCPTool(name="test_tool", description="A test tool", inputSchema={"type": "object", "properties": {}})
+_TEXT = MCPTextContent(type="text", text="Test message")
+
+
+def _noop_transport():
+    raise AssertionError("transport should not be called")
+
+
+def _ready_mcp_client(session):
+    """Build a client that reports an active session without starting a background thread or event loop.
+
+    Only suitable for paths that never dispatch to the background loop.
+    """
+    client = MCPClient(_noop_transport)
+    client._background_thread = MagicMock()
+    client._background_thread.is_alive.return_value = True
+    client._background_thread_session = session
+    client._init_future.set_result(None)
+    return client
+
+
+def _assert_result(result, status, text="Test message"):
+    assert result["status"] == status
+    assert result["toolUseId"] == "test-123"
+    assert len(result["content"]) == 1
+    assert result["content"][0]["text"] == text
+
+
+class _FakeAsyncContextManager:
+    """Async context manager that yields a preallocated value, or raises side_effect on entry."""
+
+    def __init__(self, value):
+        self.value = value
+        self.side_effect = None
+        self.enter_count = 0
+        self.exit_count = 0
+
+    async def __aenter__(self):
+        self.enter_count += 1
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.value
+
+    async def __aexit__(self, *args):
+        self.exit_count += 1
+        return False
+
+
+class _AsyncStub:
+    """Awaitable stand-in for an AsyncMock method; calls are recorded on a plain MagicMock for assertions."""
+
+    def __init__(self):
+        self.calls = MagicMock()
+        self.return_value = None
+        self.side_effect = None
+
+    async def __call__(self, *args, **kwargs):
+        self.calls(*args, **kwargs)
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
+
+    def reset_mock(self):
+        self.calls.reset_mock()
+        self.return_value = None
+        self.side_effect = None
+
+
+class _FakeSession:
+    """Stand-in for ClientSession exposing only the methods MCPClient awaits."""
+
+    def __init__(self):
+        self.initialize = _AsyncStub()
+        self.list_tools = _AsyncStub()
+        self.call_tool = _AsyncStub()
+
+    def reset_mock(self):
+        self.initialize.reset_mock()
+        self.list_tools.reset_mock()
+        self.call_tool.reset_mock()
+
 
 @pytest.fixture
 def mock_transport():
-    mock_read_stream = AsyncMock()
-    mock_write_stream = AsyncMock()
-    mock_transport_cm = AsyncMock()
-    mock_transport_cm.__aenter__.return_value = (mock_read_stream, mock_write_stream)
+    mock_read_stream = object()
+    mock_write_stream = object()
+    mock_transport_cm = _FakeAsyncContextManager((mock_read_stream, mock_write_stream))
     mock_transport_callable = MagicMock(return_value=mock_transport_cm)
 
     return {
@@ -27,255 +109,249 @@ def mock_transport():
     }
 
 
+@pytest.fixture(scope="module", autouse=True)
+def mock_client_session_cls():
+    # Patch ClientSession once for the module to return our fake session
+    patcher = patch("strands.tools.mcp.mcp_client.ClientSession")
+    mock_client_session_cls = patcher.start()
+    mock_client_session_cls.return_value = _FakeAsyncContextManager(_FakeSession())
+    yield mock_client_session_cls
+    patcher.stop()
+
+
 @pytest.fixture
-def mock_session():
-    mock_session = AsyncMock()
-    mock_session.initialize = AsyncMock()
+def mock_session(mock_client_session_cls):
+    # The session is shared with the module-scoped client, so reset it rather than replacing it.
+    # Resetting on setup too drops calls recorded while the shared client started in an earlier test.
+    mock_session = mock_client_session_cls.return_value.value
+    mock_session.reset_mock()
+    yield mock_session
+    mock_session.reset_mock()
+
 
-    # Create a mock context manager for ClientSession
-    mock_session_cm = AsyncMock()
-    mock_session_cm.__aenter__.return_value = mock_session
+@pytest.fixture(scope="module")
+def shared_mcp_client(mock_client_session_cls):
+    """A single running client reused across tests so the background thread and loop start only once."""
+    mock_transport_cm = _FakeAsyncContextManager((object(), object()))
 
-    # Patch ClientSession to return our mock session
-    with patch("strands.tools.mcp.mcp_client.ClientSession", return_value=mock_session_cm):
-        yield mock_session
+    with MCPClient(MagicMock(return_value=mock_transport_cm)) as client:
+        yield client
 
 
 @pytest.fixture
-def mcp_client(mock_transport, mock_session):
-    with MCPClient(mock_transport["transport_callable"]) as client:
-        yield client
+def inactive_mcp_client():
+    return MCPClient(_noop_transport)
 
 
-def test_mcp_client_context_manager(mock_transport, mock_session):
+def test_mcp_client_context_manager(mock_transport):
     """Test that the MCPClient context manager properly initializes and cleans up."""
-    with MCPClient(mock_transport["transport_callable"]) as client:
+    # Use a dedicated session so assertions are not affected by the shared client's session
+    mock_session = _FakeSession()
+
+    with (
+        patch("strands.tools.mcp.mcp_client.ClientSession", return_value=_FakeAsyncContextManager(mock_session)),
+        MCPClient(mock_transport["transport_callable"]) as client,
+    ):
         assert client._background_thread is not None
         assert client._background_thread.is_alive()
         assert client._init_future.done()
 
-        mock_transport["transport_cm"].__aenter__.assert_called_once()
-        mock_session.initialize.assert_called_once()
+        assert mock_transport["transport_cm"].enter_count == 1
+        assert mock_transport["transport_cm"].exit_count == 0
+        mock_session.initialize.calls.assert_called_once()
+
+        thread = client._background_thread
 
-    # After exiting the context manager, verify that the thread was cleaned up
-    # Give a small delay for the thread to fully terminate
-    time.sleep(0.1)
+    # After exiting the context manager, verify that the thread and transport were cleaned up
+    thread.join(timeout=2.0)
+    assert not thread.is_alive()
     assert client._background_thread is None
+    assert mock_transport["transport_cm"].exit_count == 1
 
 
-def test_list_tools_sync(mock_transport, mock_session):
-    """Test that list_tools_sync correctly retrieves and adapts tools."""
-    mock_tool = MCPTool(name="test_tool", description="A test tool", inputSchema={"type": "object", "properties": {}})
-    mock_session.list_tools.return_value = ListToolsResult(tools=[mock_tool])
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="eager_task_factory requires Python 3.12+")
+@pytest.mark.asyncio(loop_scope="session")
+async def test_background_loop_uses_eager_task_factory(shared_mcp_client, mock_session):
+    """Test that the background event loop runs tasks eagerly and still serves tool calls."""
+    assert shared_mcp_client._background_thread_event_loop.get_task_factory() is asyncio.eager_task_factory
 
-    with MCPClient(mock_transport["transport_callable"]) as client:
-        tools = client.list_tools_sync()
+    async def _create_task_completes_immediately():
+        async def _no_suspension():
+            return None
 
-        mock_session.list_tools.assert_called_once()
+        # An eager task that never suspends has already finished when create_task returns
+        return asyncio.get_running_loop().create_task(_no_suspension()).done()
 
-        assert len(tools) == 1
-        assert tools[0].tool_name == "test_tool"
+    assert await asyncio.wrap_future(
+        shared_mcp_client._invoke_on_background_thread(_create_task_completes_immediately())
+    )
 
+    mock_session.list_tools.return_value = ListToolsResult(tools=[_TOOL])
+    mock_session.call_tool.return_value = MCPCallToolResult(isError=False, content=[_TEXT])
 
-def test_list_tools_sync_session_not_active():
-    """Test that list_tools_sync raises an error when session is not active."""
-    client = MCPClient(MagicMock())
+    tools = shared_mcp_client.list_tools_sync()
+    result = await shared_mcp_client.call_tool_async(
+        tool_use_id="test-123", name="test_tool", arguments={"param": "value"}
+    )
 
-    with pytest.raises(MCPClientInitializationError, match="client.session is not running"):
-        client.list_tools_sync()
+    assert [tool.tool_name for tool in tools] == ["test_tool"]
+    mock_session.call_tool.calls.assert_called_once_with("test_tool", {"param": "value"}, None)
+    _assert_result(result, "success")
 
 
-@pytest.mark.parametrize("is_error,expected_status", [(False, "success"), (True, "error")])
-def test_call_tool_sync_status(mock_transport, mock_session, is_error, expected_status):
-    """Test that call_tool_sync correctly handles success and error results."""
-    mock_content = MCPTextContent(type="text", text="Test message")
-    mock_session.call_tool.return_value = MCPCallToolResult(isError=is_error, content=[mock_content])
+def test_list_tools_sync(shared_mcp_client, mock_session):
+    """Test that list_tools_sync correctly retrieves and adapts tools."""
+    mock_session.list_tools.return_value = ListToolsResult(tools=[_TOOL])
 
-    with MCPClient(mock_transport["transport_callable"]) as client:
-        result = client.call_tool_sync(tool_use_id="test-123", name="test_tool", arguments={"param": "value"})
+    tools = shared_mcp_client.list_tools_sync()
 
-        mock_session.call_tool.assert_called_once_with("test_tool", {"param": "value"}, None)
+    mock_session.list_tools.calls.assert_called_once()
 
-        assert result["status"] == expected_status
-        assert result["toolUseId"] == "test-123"
-        assert len(result["content"]) == 1
-        assert result["content"][0]["text"] == "Test message"
+    assert len(tools) == 1
+    assert tools[0].tool_name == "test_tool"
 
 
-def test_call_tool_sync_session_not_active():
-    """Test that call_tool_sync raises an error when session is not active."""
-    client = MCPClient(MagicMock())
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda client: client.list_tools_sync(),
+        lambda client: client.call_tool_sync(tool_use_id="test-123", name="test_tool", arguments={"param": "value"}),
+    ],
+    ids=["list_tools_sync", "call_tool_sync"],
+)
+def test_sync_session_not_active(inactive_mcp_client, call):
+    """Test that sync client methods raise an error when session is not active."""
+    with pytest.raises(MCPClientInitializationError, match="client.session is not running"):
+        call(inactive_mcp_client)
 
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_call_tool_async_session_not_active(inactive_mcp_client):
+    """Test that call_tool_async raises an error when session is not active."""
     with pytest.raises(MCPClientInitializationError, match="client.session is not running"):
-        client.call_tool_sync(tool_use_id="test-123", name="test_tool", arguments={"param": "value"})
+        await inactive_mcp_client.call_tool_async(
+            tool_use_id="test-123", name="test_tool", arguments={"param": "value"}
+        )
+
+
+def test_call_tool_sync_status(shared_mcp_client, mock_session):
+    """Test that call_tool_sync correctly handles success and error results."""
+    for is_error, expected_status in [(False, "success"), (True, "error")]:
+        mock_session.call_tool.return_value = MCPCallToolResult(isError=is_error, content=[_TEXT])
+
+        result = shared_mcp_client.call_tool_sync(
+            tool_use_id="test-123", name="test_tool", arguments={"param": "value"}
+        )
 
+        mock_session.call_tool.calls.assert_called_once_with("test_tool", {"param": "value"}, None)
+        mock_session.call_tool.calls.reset_mock()
 
-def test_call_tool_sync_exception(mock_transport, mock_session):
+        _assert_result(result, expected_status)
+
+
+def test_call_tool_sync_exception(shared_mcp_client, mock_session):
     """Test that call_tool_sync correctly handles exceptions."""
     mock_session.call_tool.side_effect = Exception("Test exception")
 
-    with MCPClient(mock_transport["transport_callable"]) as client:
-        result = client.call_tool_sync(tool_use_id="test-123", name="test_tool", arguments={"param": "value"})
+    result = shared_mcp_client.call_tool_sync(tool_use_id="test-123", name="test_tool", arguments={"param": "value"})
 
-        assert result["status"] == "error"
-        assert result["toolUseId"] == "test-123"
-        assert len(result["content"]) == 1
-        assert "Test exception" in result["content"][0]["text"]
+    _assert_result(result, "error", "Tool execution failed: Test exception")
 
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize("is_error,expected_status", [(False, "success"), (True, "error")])
-async def test_call_tool_async_status(mock_transport, mock_session, is_error, expected_status):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_call_tool_async_status(shared_mcp_client, mock_session):
     """Test that call_tool_async correctly handles success and error results."""
-    mock_content = MCPTextContent(type="text", text="Test message")
-    mock_result = MCPCallToolResult(isError=is_error, content=[mock_content])
-    mock_session.call_tool.return_value = mock_result
-
-    with MCPClient(mock_transport["transport_callable"]) as client:
-        # Mock asyncio.run_coroutine_threadsafe and asyncio.wrap_future
-        with (
-            patch("asyncio.run_coroutine_threadsafe") as mock_run_coroutine_threadsafe,
-            patch("asyncio.wrap_future") as mock_wrap_future,
-        ):
-            # Create a mock future that returns the mock result
-            mock_future = MagicMock()
-            mock_run_coroutine_threadsafe.return_value = mock_future
-
-            # Create an async mock that resolves to the mock result
-            async def mock_awaitable():
-                return mock_result
-
-            mock_wrap_future.return_value = mock_awaitable()
-
-            result = await client.call_tool_async(
-                tool_use_id="test-123", name="test_tool", arguments={"param": "value"}
-            )
-
-            # Verify the asyncio functions were called correctly
-            mock_run_coroutine_threadsafe.assert_called_once()
-            mock_wrap_future.assert_called_once_with(mock_future)
-
-        assert result["status"] == expected_status
-        assert result["toolUseId"] == "test-123"
-        assert len(result["content"]) == 1
-        assert result["content"][0]["text"] == "Test message"
-
-
-@pytest.mark.asyncio
-async def test_call_tool_async_session_not_active():
-    """Test that call_tool_async raises an error when session is not active."""
-    client = MCPClient(MagicMock())
+    for is_error, expected_status in [(False, "success"), (True, "error")]:
+        mock_session.call_tool.return_value = MCPCallToolResult(isError=is_error, content=[_TEXT])
 
-    with pytest.raises(MCPClientInitializationError, match="client.session is not running"):
-        await client.call_tool_async(tool_use_id="test-123", name="test_tool", arguments={"param": "value"})
+        result = await shared_mcp_client.call_tool_async(
+            tool_use_id="test-123", name="test_tool", arguments={"param": "value"}
+        )
 
+        mock_session.call_tool.calls.assert_called_once_with("test_tool", {"param": "value"}, None)
+        mock_session.call_tool.calls.reset_mock()
 
-@pytest.mark.asyncio
-async def test_call_tool_async_exception(mock_transport, mock_session):
-    """Test that call_tool_async correctly handles exceptions."""
-    with MCPClient(mock_transport["transport_callable"]) as client:
-        # Mock asyncio.run_coroutine_threadsafe to raise an exception
-        with patch("asyncio.run_coroutine_threadsafe") as mock_run_coroutine_threadsafe:
-            mock_run_coroutine_threadsafe.side_effect = Exception("Test exception")
+        _assert_result(result, expected_status)
 
-            result = await client.call_tool_async(
-                tool_use_id="test-123", name="test_tool", arguments={"param": "value"}
-            )
 
-        assert result["status"] == "error"
-        assert result["toolUseId"] == "test-123"
-        assert len(result["content"]) == 1
-        assert "Test exception" in result["content"][0]["text"]
+def test_call_tool_async_on_background_loop(shared_mcp_client, mock_session):
+    """Test that call_tool_async awaits the session directly when already on the background loop."""
+    mock_session.call_tool.return_value = MCPCallToolResult(isError=False, content=[_TEXT])
 
+    with patch(
+        "asyncio.run_coroutine_threadsafe", wraps=asyncio.run_coroutine_threadsafe
+    ) as mock_run_coroutine_threadsafe:
+        future = shared_mcp_client._invoke_on_background_thread(
+            shared_mcp_client.call_tool_async(tool_use_id="test-123", name="test_tool", arguments={"param": "value"})
+        )
+        result = future.result(timeout=2.0)
 
-@pytest.mark.asyncio
-async def test_call_tool_async_with_timeout(mock_transport, mock_session):
-    """Test that call_tool_async correctly passes timeout parameter."""
-    from datetime import timedelta
+    # Only submitting the outer coroutine crosses threads; the tool call itself does not
+    mock_run_coroutine_threadsafe.assert_called_once()
+    mock_session.call_tool.calls.assert_called_once_with("test_tool", {"param": "value"}, None)
+
+    _assert_result(result, "success")
 
-    mock_content = MCPTextContent(type="text", text="Test message")
-    mock_result = MCPCallToolResult(isError=False, content=[mock_content])
-    mock_session.call_tool.return_value = mock_result
 
-    with MCPClient(mock_transport["transport_callable"]) as client:
-        timeout = timedelta(seconds=30)
+@pytest.mark.asyncio(loop_scope="session")
+async def test_call_tool_async_exception(shared_mcp_client, mock_session):
+    """Test that call_tool_async correctly handles exceptions."""
+    # Mock asyncio.run_coroutine_threadsafe to raise an exception
+    with patch("asyncio.run_coroutine_threadsafe") as mock_run_coroutine_threadsafe:
+        mock_run_coroutine_threadsafe.side_effect = Exception("Test exception")
+
+        result = await shared_mcp_client.call_tool_async(
+            tool_use_id="test-123", name="test_tool", arguments={"param": "value"}
+        )
+
+    _assert_result(result, "error", "Tool execution failed: Test exception")
 
-        with (
-            patch("asyncio.run_coroutine_threadsafe") as mock_run_coroutine_threadsafe,
-            patch("asyncio.wrap_future") as mock_wrap_future,
-        ):
-            mock_future = MagicMock()
-            mock_run_coroutine_threadsafe.return_value = mock_future
 
-            # Create an async mock that resolves to the mock result
-            async def mock_awaitable():
-                return mock_result
+@pytest.mark.asyncio(loop_scope="session")
+async def test_call_tool_async_with_timeout(shared_mcp_client, mock_session):
+    """Test that call_tool_async correctly passes timeout parameter."""
+    from datetime import timedelta
 
-            mock_wrap_future.return_value = mock_awaitable()
+    mock_session.call_tool.return_value = MCPCallToolResult(isError=False, content=[_TEXT])
 
-            result = await client.call_tool_async(
-                tool_use_id="test-123", name="test_tool", arguments={"param": "value"}, read_timeout_seconds=timeout
-            )
+    timeout = timedelta(seconds=30)
 
-            # Verify the timeout was passed to the session call_tool method
-            # We need to check that the coroutine passed to run_coroutine_threadsafe
-            # would call session.call_tool with the timeout
-            mock_run_coroutine_threadsafe.assert_called_once()
-            mock_wrap_future.assert_called_once_with(mock_future)
+    result = await shared_mcp_client.call_tool_async(
+        tool_use_id="test-123", name="test_tool", arguments={"param": "value"}, read_timeout_seconds=timeout
+    )
 
-        assert result["status"] == "success"
-        assert result["toolUseId"] == "test-123"
+    mock_session.call_tool.calls.assert_called_once_with("test_tool", {"param": "value"}, timeout)
 
+    _assert_result(result, "success")
 
-@pytest.mark.asyncio
+
+@pytest.mark.asyncio(loop_scope="session")
 async def test_call_tool_async_initialization_not_complete():
     """Test that call_tool_async returns error result when background thread is not initialized."""
-    client = MCPClient(MagicMock())
-
-    # Manually set the client state to simulate a partially initialized state
-    client._background_thread = MagicMock()
-    client._background_thread.is_alive.return_value = True
-    client._background_thread_session = None  # Not initialized
+    # Simulate a partially initialized state where the session was never stored
+    client = _ready_mcp_client(session=None)
 
     result = await client.call_tool_async(tool_use_id="test-123", name="test_tool", arguments={"param": "value"})
 
-    assert result["status"] == "error"
-    assert result["toolUseId"] == "test-123"
-    assert len(result["content"]) == 1
-    assert "client session was not initialized" in result["content"][0]["text"]
+    _assert_result(result, "error", "Tool execution failed: the client session was not initialized")
 
 
-@pytest.mark.asyncio
-async def test_call_tool_async_wrap_future_exception(mock_transport, mock_session):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_call_tool_async_wrap_future_exception(shared_mcp_client, mock_session):
     """Test that call_tool_async correctly handles exceptions from wrap_future."""
-    with MCPClient(mock_transport["transport_callable"]) as client:
-        with (
-            patch("asyncio.run_coroutine_threadsafe") as mock_run_coroutine_threadsafe,
-            patch("asyncio.wrap_future") as mock_wrap_future,
-        ):
-            mock_future = MagicMock()
-            mock_run_coroutine_threadsafe.return_value = mock_future
-
-            # Create an async mock that raises an exception
-            async def mock_awaitable():
-                raise Exception("Wrap future exception")
-
-            mock_wrap_future.return_value = mock_awaitable()
+    mock_session.call_tool.side_effect = Exception("Wrap future exception")
 
-            result = await client.call_tool_async(
-                tool_use_id="test-123", name="test_tool", arguments={"param": "value"}
-            )
+    result = await shared_mcp_client.call_tool_async(
+        tool_use_id="test-123", name="test_tool", arguments={"param": "value"}
+    )
 
-        assert result["status"] == "error"
-        assert result["toolUseId"] == "test-123"
-        assert len(result["content"]) == 1
-        assert "Wrap future exception" in result["content"][0]["text"]
+    _assert_result(result, "error", "Tool execution failed: Wrap future exception")
 
 
 def test_enter_with_initialization_exception(mock_transport):
     """Test that __enter__ handles exceptions during initialization properly."""
     # Make the transport callable throw an exception
-    mock_transport["transport_cm"].__aenter__.side_effect = Exception("Transport initialization failed")
+    mock_transport["transport_cm"].side_effect = Exception("Transport initialization failed")
 
     client = MCPClient(mock_transport["transport_callable"])
 
@@ -283,11 +359,17 @@ def test_enter_with_initialization_exception(mock_transport):
         client.start()
 
 
+def test_start_when_session_active():
+    """Test that start raises an error when the client session is already running."""
+    client = _ready_mcp_client(session=_FakeSession())
+
+    with pytest.raises(MCPClientInitializationError, match="the client session is currently running"):
+        client.start()
+
+
 def test_exception_when_future_not_running():
     """Test exception handling when the future is not running."""
-    # Create a client.with a mock transport
-    mock_transport_callable = MagicMock()
-    client = MCPClient(mock_transport_callable)
+    client = MCPClient(_noop_transport)
 
     # Create a mock future that is not running
     mock_future = MagicMock()